@@ -16,17 +16,20 @@
 
 from PySide6.QtWidgets import QWidget, QPlainTextEdit, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, QPushButton, QFrame, QGridLayout, QFileDialog, QSpacerItem, QSizePolicy, QListWidget, QListWidgetItem
 from PySide6.QtGui import QFont, QFontMetrics
-from PySide6.QtCore import Qt
-import importlib.util
+from PySide6.QtCore import Qt, QTimer
 import os
-import shutil
 import socket
-import ssl
 import sys
 import threading
 import select
+import selectors
+import contextlib
 import io
 import datetime
+import queue
+import functools
+import collections
+from dataclasses import dataclass
 
 # Define the version number at the top
 VERSION = "1.2.0"
@@ -34,55 +37,321 @@ VERSION = "1.2.0"
 # Define the tab label for the tab widget
 TAB_LABEL = f"Parley v{VERSION}"
 
+# ASCII banner shown in the tab header, built once at import
+BANNER = f"""
+ ___    __    ___   _     ____  _    
+| |_)  / /\\  | |_) | |   | |_  \\ \\_/ 
+|_|   /_/--\\ |_| \\ |_|__ |_|__  |_|  
+
+ Version: {VERSION}"""
+
+# Bytes read per readiness event and kernel buffer size for proxied sockets
+RECV_SIZE = 65536
+SOCKET_BUFFER_SIZE = 1 << 20
+
+# Maximum number of log records the logger thread writes per batch
+LOG_BATCH_SIZE = 256
+
+# How often buffered status lines are appended, and how many lines the status box keeps
+STATUS_FLUSH_INTERVAL_MS = 50
+STATUS_MAX_LINES = 5000
+
+# Largest plaintext a single TLS record can carry
+TLS_MAX_RECORD = 16384
+
+# Upper bound on connections proxied at once; further clients wait in the pool's queue until a worker frees up
+CONNECTION_WORKERS = min(512, (os.cpu_count() or 1) * 64)
+
+# Listening sockets (each with its own accept loop) bound to the proxy port via SO_REUSEPORT where supported
+ACCEPT_LOOPS = min(os.cpu_count() or 1, 8) if hasattr(socket, 'SO_REUSEPORT') else 1
+
+# select.select() cannot watch descriptors above FD_SETSIZE (usually 1024); poll() has no such limit
+HAS_POLL = hasattr(select, 'poll')
+
+# Linux only: hold back partial segments while a module-rewritten payload is being written
+HAS_TCP_CORK = hasattr(socket, 'TCP_CORK')
+
+# Module-supplied files are streamed to plain sockets with sendfile(2) where it exists
+HAS_SENDFILE = hasattr(os, 'sendfile')
+
+# Plain-to-plain traffic without modules is moved socket -> pipe -> socket inside the kernel where splice(2) exists
+SPLICE_FLAGS = os.SPLICE_F_MOVE | os.SPLICE_F_NONBLOCK if hasattr(os, 'splice') else 0
+
+class _NoSSLError(Exception):
+    """Stand-in for the ssl want-read/write errors until ssl is imported; nothing raises it."""
+
+# Caught by the non-blocking send and receive paths; _import_ssl() swaps in the real classes before any TLS socket exists
+SSLWantReadError = SSLWantWriteError = _NoSSLError
+
+def _import_ssl():
+    """Import ssl on first TLS use and publish its want-read/write errors for the connection threads."""
+    global SSLWantReadError, SSLWantWriteError
+    import ssl
+    SSLWantReadError, SSLWantWriteError = ssl.SSLWantReadError, ssl.SSLWantWriteError
+    return ssl
+
+def tune_socket(sock):
+    """Enlarge the kernel socket buffers and disable Nagle so forwarded chunks are not delayed."""
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, SOCKET_BUFFER_SIZE)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, SOCKET_BUFFER_SIZE)
+    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+def module_function_chain(modules):
+    """Return (module_function, takes_view) pairs for modules, where takes_view marks ABI v2 modules."""
+    return tuple((module.module_function, getattr(module, 'ABI_VERSION', 1) >= 2) for module in modules.values())
+
+@functools.lru_cache(maxsize=32)
+def _log_dir_for(root, date_str):
+    """Return (and create once) the date-based log subdirectory, e.g. modules/Parley_logs/05-01-2025."""
+    log_dir = os.path.join(root, date_str)
+    os.makedirs(log_dir, exist_ok=True)
+    return log_dir
+
+@dataclass(eq=False)
+class ConnectionLogCtx:
+    """Per-connection logging state, resolved once when the connection is established."""
+    log_file_path: str
+
 class PrintRedirector(io.StringIO):
     """Redirect print statements to the StatusTextBox and connection-specific log files."""
     def __init__(self, status_textbox, root_log_dir):
         super().__init__()
         self.status_textbox = status_textbox
         self.root_log_dir = root_log_dir
-        self.log_files = {}  # Dictionary to store open log files for connections
-
-    def write(self, text, connection_info=None):
-        """Write text to StatusTextBox and connection-specific log file if connection_info is provided."""
+        self.log_files = {}  # Log files of live connections, keyed by path (owned by the logger thread)
+        # Status lines from any thread are buffered and appended in one call per timer tick. deque appends
+        # need no lock, and once the GUI falls behind the oldest lines drop off, as they would from the box
+        self._pending_lines = collections.deque(maxlen=STATUS_MAX_LINES)
+        self._status_timer = QTimer(status_textbox)
+        self._status_timer.setInterval(STATUS_FLUSH_INTERVAL_MS)
+        self._status_timer.timeout.connect(self._flush_status)
+        self._status_timer.start()
+        # Connection threads only enqueue records; a single background thread does the disk I/O
+        self._log_queue = queue.SimpleQueue()
+        self._logger_thread = threading.Thread(target=self._logger_loop, daemon=True)
+        self._logger_thread.start()
+
+    def _append_status(self, text):
+        """Queue text for StatusTextBox; safe to call from any thread."""
+        self._pending_lines.append(text.rstrip())
+
+    def _flush_status(self):
+        """Append every pending status line to StatusTextBox in one call, so the document is laid out once per tick."""
+        pending = self._pending_lines
+        popleft = pending.popleft
+        # Only this (GUI) thread removes lines, so the ones counted here are still there to take
+        lines = [popleft() for _ in range(len(pending))]
+        if lines:
+            self.status_textbox.appendPlainText('\n'.join(lines))
+
+    def open_connection_log(self, connection_info):
+        """Return the ConnectionLogCtx for a (src_ip, src_port, dst_ip, dst_port) connection."""
+        # Create log file name (e.g., 127.0.0.1-8080-example.com-80.log)
+        src_ip, src_port, dst_ip, dst_port = connection_info
+        log_filename = f"{src_ip}-{src_port}-{dst_ip}-{dst_port}.log"
+        log_dir = _log_dir_for(self.root_log_dir, datetime.date.today().strftime('%m-%d-%Y'))
+        return ConnectionLogCtx(os.path.join(log_dir, log_filename))
+
+    def close_connection_log(self, log_ctx):
+        """Close the log file of a finished connection once its queued lines have been written."""
+        self._log_queue.put_nowait((log_ctx.log_file_path, None))
+
+    def write(self, text, log_ctx=None):
+        """Write text to StatusTextBox and connection-specific log file if log_ctx is provided."""
         # Append to StatusTextBox
-        self.status_textbox.appendPlainText(text.rstrip())
-
-        # Write to connection-specific log file if connection_info is provided
-        if connection_info:
-            src_ip, src_port, dst_ip, dst_port = connection_info
-            # Create date-based subdirectory (e.g., modules/Parley_logs/05-01-2025)
-            today = datetime.date.today()
-            log_dir = os.path.join(self.root_log_dir, today.strftime('%m-%d-%Y'))
-            os.makedirs(log_dir, exist_ok=True)
+        self._append_status(text)
+
+        # Queue for the connection-specific log file if log_ctx is provided
+        if log_ctx is not None:
+            # Encode once here so the logger thread hands ready-made bytes straight to the kernel
+            self._log_queue.put_nowait((log_ctx.log_file_path, (text + '\n').encode('utf-8')))  # Add newline for consistency with logging utility
 
-            # Create log file name (e.g., 127.0.0.1-8080-example.com-80.log)
-            log_filename = f"{src_ip}-{src_port}-{dst_ip}-{dst_port}.log"
-            log_file_path = os.path.join(log_dir, log_filename)
+    def write_general(self, text):
+        """Write general (non-connection-specific) text to StatusTextBox only."""
+        self._append_status(text)
+
+    def _logger_loop(self):
+        """Drain queued log records in batches, writing each file once per batch."""
+        while True:
+            batch = [self._log_queue.get()]
+            while len(batch) < LOG_BATCH_SIZE:
+                try:
+                    batch.append(self._log_queue.get_nowait())
+                except queue.Empty:
+                    break
 
+            pending = {}
+            for log_file_path, record in batch:
+                if log_file_path is None:
+                    # Close request: write what was queued before it, then release every file
+                    self._write_pending(pending)
+                    pending = {}
+                    for log_file in self.log_files.values():
+                        log_file.close()
+                    self.log_files.clear()
+                elif record is None:
+                    # A connection ended: write its remaining lines and release its descriptor
+                    chunks = pending.pop(log_file_path, None)
+                    if chunks:
+                        self._write_pending({log_file_path: chunks})
+                    log_file = self.log_files.pop(log_file_path, None)
+                    if log_file is not None:
+                        log_file.close()
+                else:
+                    pending.setdefault(log_file_path, []).append(record)
+            self._write_pending(pending)
+
+    def _write_pending(self, pending):
+        """Write grouped log lines with a single gathered write per file."""
+        for log_file_path, chunks in pending.items():
             try:
-                # Open the log file if not already open
+                # Open the log file if not already open; unbuffered, so nothing is left to flush
                 if log_file_path not in self.log_files:
-                    self.log_files[log_file_path] = open(log_file_path, 'a', encoding='utf-8')
-                # Write to the log file
-                self.log_files[log_file_path].write(text + '\n')  # Add newline for consistency with logging utility
-                self.log_files[log_file_path].flush()
+                    try:
+                        self.log_files[log_file_path] = open(log_file_path, 'ab', buffering=0)
+                    except FileNotFoundError:
+                        # The cached date directory was removed while the proxy was running
+                        os.makedirs(os.path.dirname(log_file_path), exist_ok=True)
+                        self.log_files[log_file_path] = open(log_file_path, 'ab', buffering=0)
+                log_file = self.log_files[log_file_path]
+                if hasattr(os, 'writev'):
+                    # One writev() syscall submits the whole batch for this file
+                    written = os.writev(log_file.fileno(), chunks)
+                    remaining = b''.join(chunks)[written:] if written < sum(map(len, chunks)) else b''
+                else:
+                    remaining = b''.join(chunks)
+                while remaining:
+                    remaining = remaining[log_file.write(remaining):]
             except Exception as e:
-                self.status_textbox.appendPlainText(f"Error writing to log file {log_file_path}: {e}")
-
-    def write_general(self, text):
-        """Write general (non-connection-specific) text to StatusTextBox only."""
-        self.status_textbox.appendPlainText(text.rstrip())
+                self.write_general(f"Error writing to log file {log_file_path}: {e}")
 
     def flush(self):
-        """Flush all open log files."""
-        for log_file in self.log_files.values():
-            log_file.flush()
+        """Log files are unbuffered and written by the logger thread, so there is nothing to flush here."""
 
     def close(self):
-        """Close all open log files."""
-        for log_file in self.log_files.values():
-            log_file.close()
-        self.log_files.clear()
+        """Close all open log files once the records queued so far have been written."""
+        self._log_queue.put_nowait((None, None))
+
+class ThreadLocalStdout(io.TextIOBase):
+    """Route sys.stdout writes to a per-thread target, falling back to the original stream."""
+    def __init__(self, fallback):
+        super().__init__()
+        self.fallback = fallback
+        self._local = threading.local()
+
+    def _target(self):
+        return getattr(self._local, 'target', None) or self.fallback
+
+    def write(self, text):
+        """Write text to the current thread's target; output is dropped when there is no console (e.g., pythonw)."""
+        target = self._target()
+        if target is not None:
+            target.write(text)
+        return len(text)
+
+    def flush(self):
+        """Flush the current thread's target."""
+        target = self._target()
+        if target is not None:
+            target.flush()
+
+    @contextlib.contextmanager
+    def redirect(self, target):
+        """Send print() output from the calling thread to target for the duration of the block."""
+        previous = getattr(self._local, 'target', None)
+        self._local.target = target
+        try:
+            yield target
+        finally:
+            self._local.target = previous
+
+def install_stdout_router():
+    """Install a single process-wide ThreadLocalStdout as sys.stdout and return it."""
+    # Duck-typed check: this file may be loaded more than once, each time with its own class object
+    if not hasattr(sys.stdout, 'redirect'):
+        sys.stdout = ThreadLocalStdout(sys.stdout)
+    return sys.stdout
+
+class BufPool:
+    """Recycle receive buffers across connections in power-of-two size buckets."""
+    def __init__(self, max_per_bucket=64):
+        self.max_per_bucket = max_per_bucket
+        self._buckets = {}  # bucket size -> deque of free bytearrays; deque append/pop need no lock
+
+    def get(self, size):
+        """Return a bytearray of at least size bytes, reusing a released one when available."""
+        bucket = 1 << max(size - 1, 0).bit_length()
+        try:
+            return self._buckets[bucket].pop()
+        except (KeyError, IndexError):
+            return bytearray(bucket)
+
+    def put(self, buf):
+        """Release buf for reuse; buffers beyond the per-bucket cap are left to the garbage collector."""
+        free = self._buckets.setdefault(len(buf), collections.deque())
+        if len(free) < self.max_per_bucket:
+            free.append(buf)
+
+class ConnectionPool:
+    """Run connection handlers on at most max_workers daemon threads, started on demand and reused."""
+    def __init__(self, max_workers, name='parley-conn'):
+        self.max_workers = max_workers
+        self.name = name
+        self._jobs = queue.SimpleQueue()
+        self._lock = threading.Lock()
+        self._workers = 0
+        self._idle = 0  # Workers waiting for a job that no submit() has claimed yet
+        self._backlog = 0  # Jobs queued while every worker was busy
+        self._shutdown = False
+
+    def submit(self, fn, *args):
+        """Queue fn(*args) and return whether a worker takes it right away (False means it waits for one)."""
+        with self._lock:
+            if self._shutdown:
+                raise RuntimeError("cannot submit after shutdown")
+            if self._idle:
+                self._idle -= 1
+                started = True
+            elif self._workers < self.max_workers:
+                # Daemon, unlike ThreadPoolExecutor workers, so an idle or stuck connection never holds up exit
+                self._workers += 1
+                threading.Thread(target=self._worker, name=f"{self.name}_{self._workers}", daemon=True).start()
+                started = True
+            else:
+                self._backlog += 1
+                started = False
+            self._jobs.put((fn, args))
+        return started
+
+    def shutdown(self):
+        """Drop queued jobs and let every worker exit once its current job returns."""
+        with self._lock:
+            self._shutdown = True
+            while True:
+                try:
+                    self._jobs.get_nowait()
+                except queue.Empty:
+                    break
+            for _ in range(self._workers):
+                self._jobs.put(None)
+
+    def _worker(self):
+        while True:
+            job = self._jobs.get()
+            if job is None:
+                return
+            fn, args = job
+            try:
+                fn(*args)
+            except Exception:
+                pass  # Handlers report their own errors; the worker stays available
+            with self._lock:
+                if self._shutdown:
+                    return
+                if self._backlog:
+                    self._backlog -= 1
+                else:
+                    self._idle += 1
 
 class Ui_TabContent:
     def setupUi(self, widget):
@@ -248,6 +517,12 @@ class Ui_TabContent:
         self.StartStopButton.setFont(font1)
         self.horizontalLayout_start_stop.addWidget(self.StartStopButton)
 
+        self.PassThroughButton = QPushButton(self.frame_start_stop)
+        self.PassThroughButton.setText("Zero-Copy")
+        self.PassThroughButton.setCheckable(True)
+        self.PassThroughButton.setChecked(True)
+        self.horizontalLayout_start_stop.addWidget(self.PassThroughButton)
+
         self.horizontalSpacer_start_stop = QSpacerItem(40, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
         self.horizontalLayout_start_stop.addItem(self.horizontalSpacer_start_stop)
 
@@ -309,6 +584,7 @@ class Ui_TabContent:
 
         self.StatusTextBox = QPlainTextEdit(self.frame_4)
         self.StatusTextBox.setReadOnly(True)
+        self.StatusTextBox.setMaximumBlockCount(STATUS_MAX_LINES)
         # Set fixed-width font for StatusTextBox
         status_font = QFont("Courier New", 16)
         status_font.setFixedPitch(True)
@@ -328,23 +604,13 @@ class Ui_TabContent:
         self.retranslateUi(widget)
 
     def retranslateUi(self, widget):
-        self.label_3.setText(f"""
- ___    __    ___   _     ____  _    
-| |_)  / /\\  | |_) | |   | |_  \\ \\_/ 
-|_|   /_/--\\ |_| \\ |_|__ |_|__  |_|  
-
- Version: {VERSION}""")
-        self.label_local_ip.setText("Local IP:  ")
-        self.label_local_port.setText("Local Port:  ")
-        self.label_remote_ip.setText("Remote IP:  ")
-        self.label_remote_port.setText("Remote Port:  ")
-        self.ServerCertButton.setText("Load Server Cert")
-        self.ClientCertButton.setText("Load Client Cert")
-        self.StartStopButton.setText("Start")
-        self.ServerCertClearButton.setText("Clear")
-        self.ClientCertClearButton.setText("Clear")
+        # Captions that never change are set once in setupUi; only touch the banner if it differs
+        if self.label_3.text() != BANNER:
+            self.label_3.setText(BANNER)
 
 class TabContent(QWidget):
+    _bufpool = BufPool()  # Receive buffers shared by every connection of every tab
+
     def __init__(self):
         """Initialize the TabContent widget with custom adjustments."""
         super().__init__()
@@ -354,11 +620,20 @@ class TabContent(QWidget):
         # Proxy state
         self.proxy_thread = None
         self.proxy_running = False
-        self.server_socket = None
-        self.client_threads = []
-        self.client_sockets = []
+        self.server_sockets = []  # Listening sockets of the running proxy (several when SO_REUSEPORT is available)
+        self._connection_pool = None  # Per-run worker pool running handle_client for each accepted connection
+        self.client_sockets = set()  # Sockets of live connections, closed on stop
         self.loaded_modules_client = {}
         self.loaded_modules_server = {}
+        self._module_mtimes = {}  # module file path -> st_mtime_ns when it was last executed
+        # (module_name, status) -> QListWidgetItem currently shown in each module list
+        self._client_module_items = {}
+        self._server_module_items = {}
+        self._client_ssl_ctx = None  # Shared TLS context toward clients (uses the server cert)
+        self._server_ssl_ctx = None  # Shared TLS context toward the server (uses the client cert)
+        self._server_tls_sessions = {}  # (context, host, port) -> last TLS session from that server, offered for resumption
+        self._wakeup_reader = None  # Read end of the per-run socket pair that wakes idle connections on stop
+        self._wakeup_writer = None
 
         # Add module_libs to sys.path
         module_libs_path = os.path.join('modules', 'Parley_module_libs')
@@ -372,8 +647,17 @@ class TabContent(QWidget):
             self.ui.StatusTextBox.appendPlainText(f"Ensured directory exists: {log_dir}")
         except Exception as e:
             self.ui.StatusTextBox.appendPlainText(f"Error creating directory {log_dir}: {e}")
+        # Create the module directories once so toggling a module is just a rename
+        for modules_dir in ("Parley_modules_client", "Parley_modules_server"):
+            for status in ("enabled", "disabled"):
+                dir_path = os.path.join('modules', modules_dir, status)
+                try:
+                    os.makedirs(dir_path, exist_ok=True)
+                except Exception as e:
+                    self.ui.StatusTextBox.appendPlainText(f"Error creating directory {dir_path}: {e}")
         self.print_redirector = PrintRedirector(self.ui.StatusTextBox, log_dir)
-        sys.stdout = self.print_redirector
+        # Only threads that opt in via redirect() print to this tab, so several tabs no longer clobber each other
+        self.stdout_router = install_stdout_router()
 
         # Log initialization
         self.print_redirector.write_general(f"Parley v{VERSION} initialized.")
@@ -406,6 +690,14 @@ class TabContent(QWidget):
         self.ui.ServerCertClearButton.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
         self.ui.ClientCertClearButton.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
         self.ui.StartStopButton.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
+        self.ui.PassThroughButton.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
+
+        # Zero-copy pass-through needs splice(2); elsewhere traffic is always buffered
+        if not SPLICE_FLAGS:
+            self.ui.PassThroughButton.setChecked(False)
+            self.ui.PassThroughButton.setText("Buffered")
+            self.ui.PassThroughButton.setEnabled(False)
+        self.pass_through = self.ui.PassThroughButton.isChecked()
 
         # Initially disable server cert fields if LocalTLSButton is TCP
         self.ui.ServerCertButton.setEnabled(self.ui.LocalTLSButton.isChecked())
@@ -428,6 +720,7 @@ class TabContent(QWidget):
         self.ui.ClientModulesList.itemClicked.connect(self.toggle_client_module)
         self.ui.ServerModulesList.itemClicked.connect(self.toggle_server_module)
         self.ui.StartStopButton.clicked.connect(self.toggle_proxy)
+        self.ui.PassThroughButton.clicked.connect(self.toggle_pass_through)
 
         # Initialize module lists
         self.update_module_lists()
@@ -455,6 +748,7 @@ class TabContent(QWidget):
 
     def toggle_tls_validation(self):
         """Toggle TLS validation button between Verify and No Verify."""
+        self._server_ssl_ctx = None
         if self.ui.SkipTLSValidation.isChecked():
             self.ui.SkipTLSValidation.setText("Verify")
             self.print_redirector.write_general("TLS certificate validation enabled")
@@ -462,16 +756,24 @@ class TabContent(QWidget):
             self.ui.SkipTLSValidation.setText("No Verify")
             self.print_redirector.write_general("TLS certificate validation disabled")
 
+    def toggle_pass_through(self):
+        """Toggle pass-through button between Zero-Copy and Buffered; applies to new connections."""
+        self.pass_through = self.ui.PassThroughButton.isChecked()
+        self.ui.PassThroughButton.setText("Zero-Copy" if self.pass_through else "Buffered")
+        self.print_redirector.write_general(f"Module-less traffic set to {'zero-copy pass-through' if self.pass_through else 'buffered'}")
+
     def load_server_cert(self):
         """Load server certificate and display path."""
         file_name, _ = QFileDialog.getOpenFileName(self, "Load Server Certificate", "", "Certificate Files (*.pem *.crt);;All Files (*)")
         if file_name:
             self.ui.ServerCertPath.setText(file_name)
+            self._client_ssl_ctx = None
             self.print_redirector.write_general(f"Server certificate loaded: {file_name}")
 
     def clear_server_cert(self):
         """Clear the server certificate path text box."""
         self.ui.ServerCertPath.clear()
+        self._client_ssl_ctx = None
         self.print_redirector.write_general("Server certificate path cleared")
 
     def load_client_cert(self):
@@ -479,55 +781,63 @@ class TabContent(QWidget):
         file_name, _ = QFileDialog.getOpenFileName(self, "Load Client Certificate", "", "Certificate Files (*.pem *.crt);;All Files (*)")
         if file_name:
             self.ui.ClientCertPath.setText(file_name)
+            self._server_ssl_ctx = None
             self.print_redirector.write_general(f"Client certificate loaded: {file_name}")
 
     def clear_client_cert(self):
         """Clear the client certificate path text box."""
         self.ui.ClientCertPath.clear()
+        self._server_ssl_ctx = None
         self.print_redirector.write_general("Client certificate path cleared")
 
+    def _scan_module_dir(self, dir_path):
+        """Return the sorted module file names in dir_path using a single directory scan."""
+        try:
+            with os.scandir(dir_path) as entries:
+                return sorted(entry.name for entry in entries
+                              if entry.name.endswith(".py") and entry.name != "__init__.py" and entry.is_file())
+        except FileNotFoundError:
+            return []
+
+    def _set_module_item(self, item, module_name, status):
+        """Show module_name with its status on item, bolding enabled modules."""
+        item.setText(f"{module_name} ({status})")
+        item.setData(Qt.UserRole, (module_name, status))
+        font = item.font()
+        font.setBold(status == "enabled")
+        item.setFont(font)
+
+    def _sync_module_list(self, list_widget, items, module_dir):
+        """Bring list_widget in line with the modules under module_dir, touching only the rows that changed."""
+        modules = sorted((filename[:-3], status) for status in ("enabled", "disabled")
+                         for filename in self._scan_module_dir(os.path.join(module_dir, status)))
+        wanted = set(modules)
+        # One repaint for the whole batch instead of one per changed row
+        list_widget.setUpdatesEnabled(False)
+        try:
+            for key in [key for key in items if key not in wanted]:
+                item = items.pop(key)
+                module_name, status = key
+                moved = (module_name, "disabled" if status == "enabled" else "enabled")
+                if moved in wanted and moved not in items:
+                    # A toggled module keeps its row; only its text and font change
+                    self._set_module_item(item, *moved)
+                    items[moved] = item
+                else:
+                    list_widget.takeItem(list_widget.row(item))
+            for row, key in enumerate(modules):
+                if key not in items:
+                    item = QListWidgetItem()
+                    self._set_module_item(item, *key)
+                    list_widget.insertItem(row, item)
+                    items[key] = item
+        finally:
+            list_widget.setUpdatesEnabled(True)
+
     def update_module_lists(self):
         """Update the client and server module lists with enabled/disabled status, bolding enabled modules."""
-        self.ui.ClientModulesList.clear()
-        self.ui.ServerModulesList.clear()
-
-        # Client modules
-        client_enabled_dir = os.path.join("modules", "Parley_modules_client", "enabled")
-        client_disabled_dir = os.path.join("modules", "Parley_modules_client", "disabled")
-        client_modules = []
-        for dir_path, status in [(client_enabled_dir, "enabled"), (client_disabled_dir, "disabled")]:
-            if os.path.exists(dir_path):
-                for filename in sorted(os.listdir(dir_path)):
-                    if filename.endswith(".py") and filename != "__init__.py":
-                        module_name = filename[:-3]
-                        client_modules.append((module_name, status))
-        for module_name, status in sorted(client_modules):
-            item = QListWidgetItem(f"{module_name} ({status})")
-            item.setData(Qt.UserRole, (module_name, status))
-            if status == "enabled":
-                font = QFont()
-                font.setBold(True)
-                item.setFont(font)
-            self.ui.ClientModulesList.addItem(item)
-
-        # Server modules
-        server_enabled_dir = os.path.join("modules", "Parley_modules_server", "enabled")
-        server_disabled_dir = os.path.join("modules", "Parley_modules_server", "disabled")
-        server_modules = []
-        for dir_path, status in [(server_enabled_dir, "enabled"), (server_disabled_dir, "disabled")]:
-            if os.path.exists(dir_path):
-                for filename in sorted(os.listdir(dir_path)):
-                    if filename.endswith(".py") and filename != "__init__.py":
-                        module_name = filename[:-3]
-                        server_modules.append((module_name, status))
-        for module_name, status in sorted(server_modules):
-            item = QListWidgetItem(f"{module_name} ({status})")
-            item.setData(Qt.UserRole, (module_name, status))
-            if status == "enabled":
-                font = QFont()
-                font.setBold(True)
-                item.setFont(font)
-            self.ui.ServerModulesList.addItem(item)
+        self._sync_module_list(self.ui.ClientModulesList, self._client_module_items, os.path.join("modules", "Parley_modules_client"))
+        self._sync_module_list(self.ui.ServerModulesList, self._server_module_items, os.path.join("modules", "Parley_modules_server"))
 
     def toggle_client_module(self, item):
         """Toggle a client module between enabled and disabled and reload client modules."""
@@ -537,13 +847,18 @@ class TabContent(QWidget):
         src_path = os.path.join(src_dir, f"{module_name}.py")
         dst_path = os.path.join(dst_dir, f"{module_name}.py")
         try:
-            os.makedirs(dst_dir, exist_ok=True)
-            shutil.move(src_path, dst_path)
+            # enabled/ and disabled/ share a parent, so this is one atomic rename
+            os.replace(src_path, dst_path)
             new_status = "disabled" if status == "enabled" else "enabled"
             self.print_redirector.write_general(f"Moved client module {module_name} to {new_status}")
             self.update_module_lists()
-            # Reload client modules
-            self.load_client_modules()
+            if new_status == "enabled":
+                # Load the newly enabled module; unchanged modules are reused
+                self.load_client_modules()
+            else:
+                # Drop only the disabled module instead of reloading everything
+                self.loaded_modules_client = {name: module for name, module in self.loaded_modules_client.items() if name != module_name}
+                self._module_mtimes.pop(src_path, None)
         except Exception as e:
             self.print_redirector.write_general(f"Error moving client module {module_name}: {e}")
 
@@ -555,200 +870,526 @@ class TabContent(QWidget):
         src_path = os.path.join(src_dir, f"{module_name}.py")
         dst_path = os.path.join(dst_dir, f"{module_name}.py")
         try:
-            os.makedirs(dst_dir, exist_ok=True)
-            shutil.move(src_path, dst_path)
+            # enabled/ and disabled/ share a parent, so this is one atomic rename
+            os.replace(src_path, dst_path)
             new_status = "disabled" if status == "enabled" else "enabled"
             self.print_redirector.write_general(f"Moved server module {module_name} to {new_status}")
             self.update_module_lists()
-            # Reload server modules
-            self.load_server_modules()
+            if new_status == "enabled":
+                # Load the newly enabled module; unchanged modules are reused
+                self.load_server_modules()
+            else:
+                # Drop only the disabled module instead of reloading everything
+                self.loaded_modules_server = {name: module for name, module in self.loaded_modules_server.items() if name != module_name}
+                self._module_mtimes.pop(src_path, None)
         except Exception as e:
             self.print_redirector.write_general(f"Error moving server module {module_name}: {e}")
 
+    @property
+    def loaded_modules_client(self):
+        """Enabled client modules by name."""
+        return self._loaded_modules_client
+
+    @loaded_modules_client.setter
+    def loaded_modules_client(self, modules):
+        self._loaded_modules_client = modules
+        # Connection threads run this pre-built tuple of (module_function, takes_view) for every chunk
+        # instead of walking the dict
+        self._client_module_functions = module_function_chain(modules)
+
+    @property
+    def loaded_modules_server(self):
+        """Enabled server modules by name."""
+        return self._loaded_modules_server
+
+    @loaded_modules_server.setter
+    def loaded_modules_server(self, modules):
+        self._loaded_modules_server = modules
+        self._server_module_functions = module_function_chain(modules)
+
+    def _load_modules(self, dir_path, loaded):
+        """Return a new dict of the modules enabled in dir_path, reusing entries of loaded whose file is unchanged."""
+        # Deferred so tab start-up does not pay for the import machinery until modules are loaded
+        import importlib.util
+        modules = {}
+        for filename in self._scan_module_dir(dir_path):
+            module_name = filename[:-3]
+            module_path = os.path.join(dir_path, filename)
+            mtime = os.stat(module_path).st_mtime_ns
+            module = loaded.get(module_name)
+            if module is None or self._module_mtimes.get(module_path) != mtime:
+                spec = importlib.util.spec_from_file_location(module_name, module_path)
+                module = importlib.util.module_from_spec(spec)
+                with self.stdout_router.redirect(self.print_redirector):
+                    spec.loader.exec_module(module)
+                self._module_mtimes[module_path] = mtime
+            modules[module_name] = module
+            self.print_redirector.write_general(f"\t<-> {module_name} - {module.module_description}")
+        return modules
+
     def load_client_modules(self):
         """Load enabled client modules."""
-        self.loaded_modules_client = {}
         client_dir = os.path.join("modules", "Parley_modules_client", "enabled")
         if os.path.exists(client_dir):
             self.print_redirector.write_general("[+] Loading Client Modules...")
-            for filename in sorted(os.listdir(client_dir)):
-                if filename.endswith(".py") and filename != "__init__.py":
-                    module_name = filename[:-3]
-                    module_path = os.path.join(client_dir, filename)
-                    spec = importlib.util.spec_from_file_location(module_name, module_path)
-                    module = importlib.util.module_from_spec(spec)
-                    spec.loader.exec_module(module)
-                    self.loaded_modules_client[module_name] = module
-                    self.print_redirector.write_general(f"\t<-> {module_name} - {module.module_description}")
+            # Swap in a complete dict so connection threads never iterate a half-built one
+            self.loaded_modules_client = self._load_modules(client_dir, self.loaded_modules_client)
+        else:
+            self.loaded_modules_client = {}
 
     def load_server_modules(self):
         """Load enabled server modules."""
-        self.loaded_modules_server = {}
         server_dir = os.path.join("modules", "Parley_modules_server", "enabled")
         if os.path.exists(server_dir):
             self.print_redirector.write_general("[+] Loading Server Modules...")
-            for filename in sorted(os.listdir(server_dir)):
-                if filename.endswith(".py") and filename != "__init__.py":
-                    module_name = filename[:-3]
-                    module_path = os.path.join(server_dir, filename)
-                    spec = importlib.util.spec_from_file_location(module_name, module_path)
-                    module = importlib.util.module_from_spec(spec)
-                    spec.loader.exec_module(module)
-                    self.loaded_modules_server[module_name] = module
-                    self.print_redirector.write_general(f"\t<-> {module_name} - {module.module_description}")
+            self.loaded_modules_server = self._load_modules(server_dir, self.loaded_modules_server)
+        else:
+            self.loaded_modules_server = {}
 
     def load_modules(self):
         """Load enabled client and server modules."""
         self.load_client_modules()
         self.load_server_modules()
 
-    def handle_client(self, client_socket, target_host, target_port, use_tls_client, use_tls_server, certfile, client_certfile, verify_tls=True):
+    def _get_client_ssl_ctx(self, certfile):
+        """Return the TLS context for client-facing connections, building it only when first needed."""
+        if self._client_ssl_ctx is None:
+            # ssl is only imported once a TLS proxy is actually started
+            ssl = _import_ssl()
+            client_context = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
+            client_context.options |= ssl.OP_NO_COMPRESSION
+            if certfile:
+                client_context.load_cert_chain(certfile=certfile)
+            self._client_ssl_ctx = client_context
+        return self._client_ssl_ctx
+
+    def _get_server_ssl_ctx(self, client_certfile, verify_tls=True):
+        """Return the TLS context for server-facing connections, building it only when first needed."""
+        if self._server_ssl_ctx is None:
+            ssl = _import_ssl()
+            context = ssl.create_default_context(ssl.Purpose.SERVER_AUTH)
+            context.options |= ssl.OP_NO_COMPRESSION
+            if not verify_tls:
+                context.check_hostname = False
+                context.verify_mode = ssl.CERT_NONE
+            if client_certfile:
+                context.load_cert_chain(certfile=client_certfile)
+            # Sessions belong to the context that negotiated them; a connection of the previous run can still add
+            # one after this, but it is keyed by its own context and never offered to this one
+            self._server_tls_sessions.clear()
+            self._server_ssl_ctx = context
+        return self._server_ssl_ctx
+
+    def _wake_connections(self):
+        """Wake every connection thread blocked on the current run's wakeup socket."""
+        if self._wakeup_writer is not None:
+            try:
+                self._wakeup_writer.send(b"\0")
+            except OSError:
+                pass
+
+    def _close_wakeup(self):
+        """Close the wakeup socket pair of the previous run."""
+        for sock in (self._wakeup_reader, self._wakeup_writer):
+            if sock is not None:
+                sock.close()
+        self._wakeup_reader = self._wakeup_writer = None
+
+    def _wait_ready(self, sock, write=False):
+        """Wait until sock is readable (or writable), giving up if the proxy is stopped meanwhile."""
+        wakeup = self._wakeup_reader
+        if HAS_POLL:
+            # poll() has no FD_SETSIZE ceiling, so this keeps working with thousands of open connections
+            poller = select.poll()
+            poller.register(wakeup, select.POLLIN)
+            poller.register(sock, select.POLLOUT if write else select.POLLIN)
+            stopped = any(fd == wakeup.fileno() for fd, _ in poller.poll())
+        else:
+            watch = [sock]
+            readable, _, _ = select.select([wakeup] if write else [wakeup, sock], watch if write else [], watch)
+            stopped = wakeup in readable
+        if stopped or not self.proxy_running:
+            raise ConnectionAbortedError("Proxy stopped")
+
+    def _tls_handshake(self, sock):
+        """Drive the TLS handshake of a non-blocking socket, waiting on whichever direction OpenSSL asks for."""
+        while True:
+            try:
+                sock.do_handshake()
+                return
+            except SSLWantReadError:
+                self._wait_ready(sock)
+            except SSLWantWriteError:
+                self._wait_ready(sock, write=True)
+
+    def _send_all(self, sock, data):
+        """Send all of data on a non-blocking socket, waiting whenever the kernel send buffer is full."""
+        view = memoryview(data)
+        while view:
+            try:
+                view = view[sock.send(view):]
+            except (BlockingIOError, SSLWantWriteError):
+                self._wait_ready(sock, write=True)
+            except SSLWantReadError:
+                self._wait_ready(sock)
+
+    def _recv_tls_batch(self, sock, recv_view, received, batch):
+        """Append to recv_view whatever a TLS socket can deliver right now, returning the new byte count."""
+        # Decrypted bytes OpenSSL has buffered are invisible to the selector, so they are always drained. With
+        # batch set, further whole records are gathered while a maximum-size record still fits, so module-less
+        # traffic reaches the peer in one send instead of one per record
+        try:
+            while sock.pending() or (batch and received <= RECV_SIZE - TLS_MAX_RECORD):
+                n = sock.recv_into(recv_view[received:])
+                if not n:
+                    break
+                received += n
+        except OSError:
+            # Nothing more is queued (SSLWantReadError), or an error that the next read reports again
+            pass
+        return received
+
+    def _remember_tls_session(self, sock, target_host, target_port):
+        """Keep the TLS session of a server connection so the next connection to that server can resume it."""
+        session = getattr(sock, 'session', None)
+        if session is not None:
+            self._server_tls_sessions[(sock.context, target_host, target_port)] = session
+
+    def _send_file(self, sock, fileobj):
+        """Send a module-supplied file object from its current position to EOF, then close it."""
+        try:
+            fd = fileobj.fileno()
+        except (AttributeError, OSError):
+            fd = None  # In-memory streams such as io.BytesIO have no descriptor
+        try:
+            if HAS_SENDFILE and fd is not None and type(sock) is socket.socket:
+                # sendfile(2) copies page cache to socket without the data entering Python
+                offset = fileobj.tell()
+                while True:
+                    try:
+                        sent = os.sendfile(sock.fileno(), fd, offset, SOCKET_BUFFER_SIZE)
+                    except BlockingIOError:
+                        self._wait_ready(sock, write=True)
+                        continue
+                    if not sent:
+                        break
+                    offset += sent
+            else:
+                # TLS peers need the plaintext in user space to encrypt it
+                for chunk in iter(functools.partial(fileobj.read, RECV_SIZE), b''):
+                    self._send_all(sock, chunk)
+        finally:
+            fileobj.close()
+
+    def _send_corked(self, sock, data):
+        """Send data with TCP_CORK held, so rewritten payloads (and every TLS record they span) leave as full-sized segments."""
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_CORK, 1)
+        try:
+            self._send_all(sock, data)
+        finally:
+            # Uncorking pushes out the final partial segment immediately
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_CORK, 0)
+
+    def _splice_all(self, pipe_read, sock, count):
+        """Move count bytes already spliced into a pipe on to sock, waiting whenever the kernel send buffer is full."""
+        while count:
+            try:
+                count -= os.splice(pipe_read, sock.fileno(), count, flags=SPLICE_FLAGS)
+            except BlockingIOError:
+                self._wait_ready(sock, write=True)
+
+    def handle_client(self, client_socket, target_host, target_port, client_ssl_ctx=None, server_ssl_ctx=None):
         """Handle client connection in a separate thread."""
         forward_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        self.client_sockets.append(client_socket)
-        self.client_sockets.append(forward_socket)
+        self.client_sockets.add(forward_socket)
+        sel = None
+        splice_pipe = None
+        recv_bufs = ()
+        log_ctx = None
         try:
-            forward_socket.connect((target_host, target_port))
+            tune_socket(forward_socket)
+            # Both legs stay non-blocking so a stop request can interrupt connects and handshakes,
+            # and a TLS read that only yields a post-handshake message cannot stall the thread
+            client_socket.setblocking(False)
+            forward_socket.setblocking(False)
+            try:
+                forward_socket.connect((target_host, target_port))
+            except BlockingIOError:
+                self._wait_ready(forward_socket, write=True)
+                error = forward_socket.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR)
+                if error:
+                    raise OSError(error, os.strerror(error))
             client_ip, client_port = client_socket.getpeername()
             server_ip, server_port = forward_socket.getpeername()
-            connection_info = (client_ip, client_port, server_ip, server_port)
-            self.print_redirector.write(f"[+] Connected to server: {client_ip}:{client_port} -> {server_ip}:{server_port}", connection_info)
-
-            if use_tls_server:
-                context = ssl.create_default_context(ssl.Purpose.SERVER_AUTH)
-                if not verify_tls:
-                    context.check_hostname = False
-                    context.verify_mode = ssl.CERT_NONE
-                if client_certfile:
-                    context.load_cert_chain(certfile=client_certfile)
-                forward_socket = context.wrap_socket(forward_socket, server_hostname=target_host)
-
-            if use_tls_client:
-                client_context = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
-                if certfile:
-                    client_context.load_cert_chain(certfile=certfile)
-                client_socket = client_context.wrap_socket(client_socket, server_side=True)
-
-            sockets = [client_socket, forward_socket]
-            buffer_size = 4096
+            # The log file path is worked out once here instead of on every logged line
+            log_ctx = self.print_redirector.open_connection_log((client_ip, client_port, server_ip, server_port))
+            self.print_redirector.write(f"[+] Connected to server: {client_ip}:{client_port} -> {server_ip}:{server_port}", log_ctx)
+
+            if server_ssl_ctx is not None:
+                # Wrapping detaches the plain socket, so track the TLS socket that now owns the descriptor
+                self.client_sockets.discard(forward_socket)
+                # Resuming the previous session to this server skips the full key exchange and certificate checks
+                forward_socket = server_ssl_ctx.wrap_socket(forward_socket, server_hostname=target_host, do_handshake_on_connect=False,
+                                                            session=self._server_tls_sessions.get((server_ssl_ctx, target_host, target_port)))
+                self.client_sockets.add(forward_socket)
+                self._tls_handshake(forward_socket)
+
+            if client_ssl_ctx is not None:
+                self.client_sockets.discard(client_socket)
+                client_socket = client_ssl_ctx.wrap_socket(client_socket, server_side=True, do_handshake_on_connect=False)
+                self.client_sockets.add(client_socket)
+                self._tls_handshake(client_socket)
+
+            # Register both peers once; the kernel keeps the interest set across iterations and each
+            # key carries a pre-built (peer, is_tls, recv_view, alive_bit) routing tuple so events need no
+            # per-packet lookups. Each direction reads into its own reusable buffer; traffic without modules
+            # is sent straight from it
+            recv_bufs = (self._bufpool.get(RECV_SIZE), self._bufpool.get(RECV_SIZE))
+            sel = selectors.DefaultSelector()
+            sel.register(client_socket, selectors.EVENT_READ, (forward_socket, client_ssl_ctx is not None, memoryview(recv_bufs[0]), 0b01))
+            sel.register(forward_socket, selectors.EVENT_READ, (client_socket, server_ssl_ctx is not None, memoryview(recv_bufs[1]), 0b10))
+            sel.register(self._wakeup_reader, selectors.EVENT_READ, None)
+            select_ready = sel.select
+            # Bound once so the per-chunk path skips the attribute lookups
+            send_all = self._send_all
+            send_corked = self._send_corked if HAS_TCP_CORK else send_all
+            splice_all = self._splice_all
+            alive = 0b11  # One bit per peer still sending
+            half_close = client_ssl_ctx is None and server_ssl_ctx is None
             client_msg_num = 0
             server_msg_num = 0
-
-            while sockets and self.proxy_running:
-                readable, _, errored = select.select(sockets, [], sockets, 1.0)
-                for s in errored:
-                    sockets.remove(s)
-                    s.close()
-                for s in readable:
-                    full_data = bytearray()
-                    try:
-                        while True:
-                            data = s.recv(buffer_size)
-                            if not data:
+            tls_session_pending = server_ssl_ctx is not None
+            if self.pass_through and SPLICE_FLAGS and client_ssl_ctx is None and server_ssl_ctx is None:
+                # Pass-through traffic never enters user space; TLS legs need the plaintext, so they cannot use it
+                splice_pipe = os.pipe()
+
+            # Module print() output on this thread goes to this tab's status box
+            with self.stdout_router.redirect(self.print_redirector):
+                while alive and self.proxy_running:
+                    # Idle connections sleep until traffic arrives or stop_proxy() signals the wakeup socket
+                    for key, _ in select_ready():
+                        if key.data is None:
+                            break
+                        s = key.fileobj
+                        peer, is_tls, recv_view, alive_bit = key.data
+                        # Snapshot once so a module toggled mid-chunk cannot change how this chunk is handled
+                        module_functions = self._client_module_functions if s is client_socket else self._server_module_functions
+                        try:
+                            if splice_pipe is not None and not module_functions:
+                                received = os.splice(s.fileno(), splice_pipe[1], RECV_SIZE, flags=SPLICE_FLAGS)
+                            else:
+                                # One large read per readiness event; the selector wakes again if more is queued
+                                received = s.recv_into(recv_view)
+                                if is_tls and received:
+                                    received = self._recv_tls_batch(s, recv_view, received, not module_functions)
+                        except (BlockingIOError, SSLWantReadError, SSLWantWriteError):
+                            # Spurious wakeup, partial TLS record or a post-handshake message such as a session ticket
+                            continue
+                        except socket.error:
+                            break
+                        if received:
+                            if s is client_socket:
+                                client_msg_num += 1
+                            else:
+                                server_msg_num += 1
+                                if tls_session_pending:
+                                    # TLS 1.3 tickets arrive after the handshake, so the session is only
+                                    # resumable once the server has sent something
+                                    self._remember_tls_session(forward_socket, target_host, target_port)
+                                    tls_session_pending = False
+                            if splice_pipe is not None and not module_functions:
+                                splice_all(splice_pipe[0], peer, received)
+                                continue
+                            full_data = recv_view[:received]
+                            if not module_functions:
+                                send_all(peer, full_data)
+                                continue
+                            if s is client_socket:
+                                message_info = (client_msg_num, client_ip, client_port, server_ip, server_port)
+                            else:
+                                message_info = (server_msg_num, server_ip, server_port, client_ip, client_port)
+                            for module_function, takes_view in module_functions:
+                                if takes_view:
+                                    # ABI v2 modules work on a view, straight over the receive buffer when possible
+                                    if type(full_data) is bytearray:
+                                        full_data = memoryview(full_data)
+                                    elif type(full_data) is not memoryview or full_data.readonly:
+                                        # bytes (e.g. from a v1 module) or a read-only view would reject in-place writes
+                                        full_data = memoryview(bytearray(full_data))
+                                elif type(full_data) is memoryview:
+                                    # v1 modules get their own mutable copy since the receive buffer is reused
+                                    full_data = bytearray(full_data)
+                                full_data = module_function(*message_info, full_data)
+                            if isinstance(full_data, (bytes, bytearray, memoryview)):
+                                send_corked(peer, full_data)
+                            elif hasattr(full_data, 'read'):
+                                # A module handed over a file object (e.g. an upload body) to stream instead
+                                self._send_file(peer, full_data)
+                            else:
+                                raise TypeError(f"module {module_function.__module__} returned {type(full_data).__name__}, expected a bytes-like or binary file object")
+                        else:
+                            if not half_close:
+                                # A TLS socket cannot be half-closed without dropping its TLS state, so one side
+                                # finishing ends the connection (the finally block closes both legs)
                                 break
-                            full_data.extend(data)
-                            if len(data) < buffer_size:
+                            # Pass the EOF on so the other side finishes too and this worker is freed; the
+                            # opposite direction keeps flowing until it ends as well
+                            sel.unregister(s)
+                            try:
+                                peer.shutdown(socket.SHUT_WR)
+                            except OSError:
+                                break
+                            alive &= ~alive_bit
+                            if not alive:
                                 break
-                    except socket.error:
-                        break
-                    if full_data:
-                        if s is client_socket:
-                            client_msg_num += 1
-                            for module_name, module in self.loaded_modules_client.items():
-                                full_data = module.module_function(client_msg_num, client_ip, client_port, server_ip, server_port, full_data)
-                            forward_socket.sendall(full_data)
-                        else:
-                            server_msg_num += 1
-                            for module_name, module in self.loaded_modules_server.items():
-                                full_data = module.module_function(server_msg_num, server_ip, server_port, client_ip, client_port, full_data)
-                            client_socket.sendall(full_data)
-                    else:
-                        sockets.remove(s)
-                        s.close()
-                        if len(sockets) == 0:
-                            break
         except Exception as e:
-            self.print_redirector.write(f"Error in connection: {e}", connection_info if 'connection_info' in locals() else None)
+            self.print_redirector.write(f"Error in connection: {e}", log_ctx)
         finally:
+            if log_ctx is not None:
+                self.print_redirector.close_connection_log(log_ctx)
+            if sel is not None:
+                sel.close()
+            if splice_pipe is not None:
+                for fd in splice_pipe:
+                    os.close(fd)
+            for buf in recv_bufs:
+                self._bufpool.put(buf)
             for sock in [client_socket, forward_socket]:
-                if sock in self.client_sockets:
-                    self.client_sockets.remove(sock)
+                self.client_sockets.discard(sock)
                 try:
                     sock.close()
                 except:
                     pass
 
-    def start_proxy(self, listen_host, listen_port, target_host, target_port, use_tls_client, use_tls_server, certfile, client_certfile, verify_tls=True):
-        """Start the proxy server in a loop."""
-        self.server_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        self.server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    def _open_listeners(self, listen_host, listen_port):
+        """Bind ACCEPT_LOOPS listening sockets to the same address, tracking them in self.server_sockets."""
+        if ACCEPT_LOOPS > 1:
+            # Probe without SO_REUSEPORT first, so a port that is already taken (e.g. by another Parley tab)
+            # still fails loudly instead of silently sharing its connections
+            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as probe:
+                probe.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+                probe.bind((listen_host, listen_port))
+        for _ in range(ACCEPT_LOOPS):
+            server_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            self.server_sockets.append(server_socket)
+            server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            if ACCEPT_LOOPS > 1:
+                # The kernel spreads incoming connections across every socket in the group
+                server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+            # Accepted sockets inherit this, so the window scale offered in the SYN-ACK already fits it
+            server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, SOCKET_BUFFER_SIZE)
+            server_socket.bind((listen_host, listen_port))
+            server_socket.listen(5)
+            server_socket.setblocking(False)
+
+    def _accept_loop(self, server_socket, target_host, target_port, client_ssl_ctx, server_ssl_ctx):
+        """Accept connections on one listening socket until the proxy stops, handing each to its own thread."""
+        # Sleep until a client connects or stop_proxy() signals the wakeup socket, instead of
+        # waking every second to poll proxy_running
+        sel = selectors.DefaultSelector()
         try:
-            self.server_socket.bind((listen_host, listen_port))
-            self.server_socket.listen(5)
-            self.print_redirector.write_general(f"[+] Listening on: {listen_host}:{listen_port}")
+            sel.register(server_socket, selectors.EVENT_READ, True)
+            sel.register(self._wakeup_reader, selectors.EVENT_READ, False)
             while self.proxy_running:
-                try:
-                    self.server_socket.settimeout(1.0)  # Allow checking proxy_running
-                    client_socket, addr = self.server_socket.accept()
-                    client_ip, client_port = client_socket.getpeername()
-                    self.print_redirector.write_general(f"[+] New server socket thread started for {client_ip}:{client_port}")
-                    client_thread = threading.Thread(target=self.handle_client, args=(client_socket, target_host, target_port, use_tls_client, use_tls_server, certfile, client_certfile, verify_tls))
-                    client_thread.daemon = True  # Make client threads daemon
-                    client_thread.start()
-                    self.client_threads.append(client_thread)
-                except socket.timeout:
-                    continue
-                except Exception as e:
-                    self.print_redirector.write_general(f"Error accepting connection: {e}")
+                if not all(key.data for key, _ in sel.select()):
                     break
+                # Accept every connection already queued before going back to sleep
+                while self.proxy_running:
+                    try:
+                        client_socket, addr = server_socket.accept()
+                    except BlockingIOError:
+                        break
+                    try:
+                        tune_socket(client_socket)
+                        client_ip, client_port = client_socket.getpeername()
+                    except OSError as e:
+                        # The client went away before it could be handed to a thread
+                        self.print_redirector.write_general(f"Error accepting connection: {e}")
+                        client_socket.close()
+                        continue
+                    # Tracked from here so a stop also closes connections still queued for a worker
+                    self.client_sockets.add(client_socket)
+                    try:
+                        started = self._connection_pool.submit(self.handle_client, client_socket, target_host, target_port, client_ssl_ctx, server_ssl_ctx)
+                    except RuntimeError:
+                        # The proxy is stopping and the pool no longer takes work
+                        self.client_sockets.discard(client_socket)
+                        client_socket.close()
+                        break
+                    if started:
+                        self.print_redirector.write_general(f"[+] New server socket thread started for {client_ip}:{client_port}")
+                    else:
+                        self.print_redirector.write_general(f"[!] Connection from {client_ip}:{client_port} queued: all {CONNECTION_WORKERS} connection workers busy")
+        except Exception as e:
+            self.print_redirector.write_general(f"Error accepting connection: {e}")
+            # A failed listener stops the whole proxy, including the other accept loops
+            self.proxy_running = False
+            self._wake_connections()
+        finally:
+            sel.close()
+
+    def start_proxy(self, listen_host, listen_port, target_host, target_port, client_ssl_ctx=None, server_ssl_ctx=None):
+        """Start the proxy server in a loop."""
+        listeners = self.server_sockets = []
+        accept_threads = []
+        connection_pool = self._connection_pool
+        try:
+            self._open_listeners(listen_host, listen_port)
+            self.print_redirector.write_general(f"[+] Listening on: {listen_host}:{listen_port}")
+            # One accept loop per listener; this thread runs the first one itself
+            args = (target_host, target_port, client_ssl_ctx, server_ssl_ctx)
+            for server_socket in listeners[1:]:
+                accept_thread = threading.Thread(target=self._accept_loop, args=(server_socket,) + args, daemon=True)
+                accept_thread.start()
+                accept_threads.append(accept_thread)
+            self._accept_loop(listeners[0], *args)
         except Exception as e:
             self.print_redirector.write_general(f"Error starting proxy: {e}")
         finally:
             # Clean up without joining the current thread
             self.proxy_running = False
-            if self.server_socket:
+            self._wake_connections()
+            for accept_thread in accept_threads:
+                accept_thread.join()
+            for server_socket in listeners:
                 try:
-                    self.server_socket.close()
+                    server_socket.close()
                 except:
                     pass
-                self.server_socket = None
+            if self.server_sockets is listeners:
+                self.server_sockets = []
             # Close all client sockets to unblock select
-            for sock in self.client_sockets[:]:
+            for sock in list(self.client_sockets):
                 try:
                     sock.close()
                 except:
                     pass
-                if sock in self.client_sockets:
-                    self.client_sockets.remove(sock)
-            # Clear client threads list (daemon threads will terminate on exit)
-            self.client_threads.clear()
+                self.client_sockets.discard(sock)
+            # Queued connections were closed above; running ones exit on the wakeup socket
+            connection_pool.shutdown()
             self.print_redirector.write_general("[-] Proxy stopped")
 
     def stop_proxy(self):
         """Stop the proxy and clean up resources."""
         self.print_redirector.write_general("Exiting and closing threads")
         self.proxy_running = False
-        if self.server_socket:
+        self._wake_connections()
+        for server_socket in self.server_sockets:
             try:
-                self.server_socket.close()
+                server_socket.close()
             except:
                 pass
-            self.server_socket = None
+        self.server_sockets = []
         # Close all client sockets to unblock select
-        for sock in self.client_sockets[:]:
+        for sock in list(self.client_sockets):
             try:
                 sock.close()
             except:
                 pass
-            if sock in self.client_sockets:
-                self.client_sockets.remove(sock)
-        # Wait for client threads to terminate
-        for thread in self.client_threads[:]:
-            try:
-                thread.join(timeout=1.0)
-            except:
-                pass
-            self.client_threads.remove(thread)
+            self.client_sockets.discard(sock)
+        # Drop connections still waiting for a worker; running ones exit on the wakeup socket
+        if self._connection_pool is not None:
+            self._connection_pool.shutdown()
         self.print_redirector.write_general("[-] Proxy stopped")
         # Close all log files
         self.print_redirector.close()
@@ -775,9 +1416,18 @@ class TabContent(QWidget):
                     return
 
                 self.load_modules()
+                # Contexts are shared by every connection of this run (and reused across runs until settings change)
+                client_ssl_ctx = self._get_client_ssl_ctx(certfile) if use_tls_client else None
+                server_ssl_ctx = self._get_server_ssl_ctx(client_certfile, verify_tls) if use_tls_server else None
+                # Fresh wakeup pair per run: stop_proxy() writes one byte that is never read, so every
+                # connection of this run sees it as readable no matter when it next blocks
+                self._close_wakeup()
+                self._wakeup_reader, self._wakeup_writer = socket.socketpair()
+                # A pool cannot be restarted once shut down, so each run gets its own
+                self._connection_pool = ConnectionPool(CONNECTION_WORKERS)
                 self.proxy_running = True
                 self.ui.StartStopButton.setText("Stop")
-                self.proxy_thread = threading.Thread(target=self.start_proxy, args=(listen_host, listen_port, target_host, target_port, use_tls_client, use_tls_server, certfile, client_certfile, verify_tls))
+                self.proxy_thread = threading.Thread(target=self.start_proxy, args=(listen_host, listen_port, target_host, target_port, client_ssl_ctx, server_ssl_ctx))
                 self.proxy_thread.daemon = True  # Make proxy thread daemon
                 self.proxy_thread.start()
                 self.print_redirector.write_general(f"Started proxy: {listen_host}:{listen_port} -> {target_host}:{target_port}")
@@ -794,6 +1444,7 @@ class TabContent(QWidget):
         """Clean up resources before closing."""
         if self.proxy_running:
             self.stop_proxy()
+        self._close_wakeup()
 
     def showEvent(self, event):
         """Set focus to LocalIPLine when the tab is shown."""